@@ -5,6 +5,7 @@ sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
 
 from mict.mict_framework import MICT
 from mict.cell_cycle import CellMICT # Import CellMICT
+from mict.synaptic_delay import DelayLine
 
 # --- Neuron Parameters (Same as before) ---
 V_REST = -70.0; V_THRESHOLD = -55.0; V_RESET = -75.0; TAU_M = 10.0; R_M = 10.0; DT = 0.1
@@ -12,24 +13,14 @@ V_REST = -70.0; V_THRESHOLD = -55.0; V_RESET = -75.0; TAU_M = 10.0; R_M = 10.0;
 # --- Modified Neuron Stage Functions (to handle synaptic input) ---
 # We'll create instances of these functions for each neuron
 
-def create_neuron_stage_functions(neuron_id, synapse_weights):
+def create_neuron_stage_functions(neuron_id):
     """Creates MICT stage functions for a specific neuron."""
 
     def neuron_mapping(state):
-        # Receive input current from connected neurons
+        # Receive input current: external drive plus the synaptic input delivered by the delay line
         input_current = state.get('base_current', 1.0) # Base external input
-        received_signals = state.get('received_signals', {})
-
-        for pre_synaptic_id, weight in synapse_weights.get(neuron_id, {}).items():
-            # Get output signal from the pre-synaptic neuron's *previous* state
-            # In a full simulation manager, you'd get this from the shared state
-            # For this simple example, we'll assume a global state dict (not ideal!)
-            if pre_synaptic_id in global_neuron_states:
-                 # Get the output from the previous Transformation stage
-                input_current += global_neuron_states[pre_synaptic_id].get('output_signal', 0) * weight
-
+        input_current += state.get('synaptic_input', 0.0)
         state['input_current'] = input_current
-        state['received_signals'] = {} # Clear received signals for next step
         # print(f"Neuron {state['cell_id']} Map: Input Current = {state['input_current']:.2f}")
         return state
 
@@ -76,14 +67,12 @@ def create_neuron_stage_functions(neuron_id, synapse_weights):
 
 # --- Simulation Setup ---
 if __name__ == "__main__":
-    # Define synaptic connections and weights
-    # N1 sends excitatory input to N2
-    synapses = {
-        "N2": {"N1": 1.5} # Target Neuron: {Source Neuron: Weight}
-    }
-
-    # Shared state dictionary (Simplified approach for this example)
-    global_neuron_states = {}
+    # Define synaptic connections, weights and delays
+    # N1 sends excitatory input to N2, arriving one step (one full cell cycle) later
+    synapses = [
+        ("N1", "N2", 1.5, 1) # (Source Neuron, Target Neuron, Weight, Delay in steps)
+    ]
+    delay_line = DelayLine.from_synapses(["N1", "N2"], synapses)
 
     # --- Create Neurons ---
     neuron1_initial_state = {
@@ -91,18 +80,17 @@ if __name__ == "__main__":
         'base_current': 1.6, # Constant input to make N1 fire periodically
         'params': {'R_M': R_M, 'TAU_M': TAU_M, 'DT': DT}
     }
-    neuron1_funcs = create_neuron_stage_functions("N1", synapses)
+    neuron1_funcs = create_neuron_stage_functions("N1")
     neuron1 = CellMICT("N1", "neuron", neuron1_initial_state, stageFunctions=neuron1_funcs)
-    global_neuron_states["N1"] = neuron1.currentState # Add to shared state
 
     neuron2_initial_state = {
         'membrane_potential': V_REST, 'output_signal': 0, 'fired_this_step': False,
         'base_current': 0.0, # No base input for N2
         'params': {'R_M': R_M, 'TAU_M': TAU_M, 'DT': DT}
     }
-    neuron2_funcs = create_neuron_stage_functions("N2", synapses)
+    neuron2_funcs = create_neuron_stage_functions("N2")
     neuron2 = CellMICT("N2", "neuron", neuron2_initial_state, stageFunctions=neuron2_funcs)
-    global_neuron_states["N2"] = neuron2.currentState # Add to shared state
+    neurons = [neuron1, neuron2] # Same order as the delay line's cell IDs
 
 
     print("--- Running Two Neuron Interaction Simulation ---")
@@ -110,24 +98,22 @@ if __name__ == "__main__":
     for i in range(1000):
         print(f"\n--- Step {i} ---")
 
-        # Store previous outputs before stepping
-        prev_outputs = {
-            "N1": global_neuron_states["N1"].get('output_signal', 0),
-            "N2": global_neuron_states["N2"].get('output_signal', 0)
-        }
-
-        # Pass previous output to the *next* mapping step (simplified communication)
-        # In a real manager, this would be handled more robustly
-        neuron1.currentState['received_signals'] = {} # Clear first
-        neuron2.currentState['received_signals'] = {"N1": prev_outputs["N1"]} # N2 receives from N1
-
-        # Step both neurons through their MICT cycles
-        neuron1.step()
-        neuron2.step()
-
-        # Update the global state (for the next iteration's input calculation)
-        global_neuron_states["N1"] = neuron1.currentState
-        global_neuron_states["N2"] = neuron2.currentState
+        # Deliver the synaptic input arriving at this step (one array read for all neurons)
+        synaptic_input = delay_line.read()
+        for index, neuron in enumerate(neurons):
+            neuron.currentState['synaptic_input'] = synaptic_input[index]
+
+        # Step both neurons through one full MICT cycle (Mapping ... Transformation),
+        # so one delay step corresponds to one cell step
+        for neuron in neurons:
+            for _ in range(neuron.cycle_length):
+                neuron.step()
+
+        # Send this step's outputs (set in Transformation) through the synapses,
+        # to arrive after each synapse's delay
+        for neuron in neurons:
+            delay_line.emit(neuron.cell_id, neuron.currentState.get('output_signal', 0))
+        delay_line.advance()
 
         # Optional: time.sleep(0.01)
 
@@ -0,0 +1,128 @@
+# mict/arena.py
+import math
+from collections import defaultdict
+from typing import Dict, Any, Optional, List, Tuple
+
+Position = Tuple[float, float]
+
+
+class SpatialHash:
+    """
+    Uniform-grid spatial hash for neighbour queries between organisms.
+
+    Points are bucketed by grid cell, so a radius query only inspects the buckets overlapping
+    the query circle. With a cell size close to the query radius, the cost of finding every
+    organism's neighbours grows roughly linearly with the number of organisms.
+
+    Args:
+        cell_size (float): Edge length of a grid cell (best set to the typical query radius).
+    """
+    def __init__(self, cell_size: float):
+        if cell_size <= 0:
+            raise ValueError(f"cell_size must be positive, got {cell_size}")
+        self.cell_size = cell_size
+        self._buckets: Dict[Tuple[int, int], List[str]] = defaultdict(list)
+        self._positions: Dict[str, Position] = {}
+
+    def cell_of(self, position: Position) -> Tuple[int, int]:
+        """Returns the grid cell containing a position."""
+        return (math.floor(position[0] / self.cell_size), math.floor(position[1] / self.cell_size))
+
+    def rebuild(self, positions: Dict[str, Position]):
+        """Replaces the indexed points (called once per step, after organisms have moved)."""
+        self._buckets.clear()
+        self._positions = dict(positions)
+        for item_id, position in self._positions.items():
+            self._buckets[self.cell_of(position)].append(item_id)
+
+    def query(self, position: Position, radius: float) -> List[str]:
+        """Returns the IDs of all indexed points within `radius` of `position`."""
+        x, y = position
+        cx, cy = self.cell_of(position)
+        reach = math.ceil(radius / self.cell_size)
+        radius_sq = radius * radius
+        found = []
+        for ix in range(cx - reach, cx + reach + 1):
+            for iy in range(cy - reach, cy + reach + 1):
+                for item_id in self._buckets.get((ix, iy), ()):
+                    px, py = self._positions[item_id]
+                    if (px - x) ** 2 + (py - y) ** 2 <= radius_sq:
+                        found.append(item_id)
+        return found
+
+    def neighbors(self, item_id: str, radius: float) -> List[str]:
+        """Returns the IDs of the other indexed points within `radius` of `item_id`."""
+        return [other for other in self.query(self._positions[item_id], radius) if other != item_id]
+
+
+class Arena:
+    """
+    Shared environment for a population of organisms: contact sensing and local food depletion.
+
+    Each step, organisms' positions are indexed in a SpatialHash. Every organism then gets the
+    IDs of the organisms within `contact_radius` ('contacts') and eats from the food patch under
+    it ('food_eaten', 'local_food'). Food lives on a sparse grid of patches, so only patches
+    that hold food are stored.
+
+    Args:
+        width (float): Arena width (used to place organisms).
+        height (float): Arena height (used to place organisms).
+        contact_radius (float): Distance at which two organisms touch.
+        food (Optional[Dict[Tuple[int, int], float]]): Food amount per patch (grid cell index).
+        food_cell_size (float): Edge length of a food patch.
+        consumption_rate (float): Maximum food eaten per organism per unit time.
+    """
+    def __init__(self, width: float, height: float, contact_radius: float = 1.0,
+                 food: Optional[Dict[Tuple[int, int], float]] = None, food_cell_size: float = 1.0,
+                 consumption_rate: float = 0.1):
+        self.width = width
+        self.height = height
+        self.contact_radius = contact_radius
+        self.food = dict(food or {})
+        self.food_cell_size = food_cell_size
+        self.consumption_rate = consumption_rate
+        self.spatial_hash = SpatialHash(contact_radius)
+
+    def food_cell_of(self, position: Position) -> Tuple[int, int]:
+        """Returns the food patch containing a position."""
+        return (math.floor(position[0] / self.food_cell_size), math.floor(position[1] / self.food_cell_size))
+
+    def step(self, organism_states: Dict[str, Dict[str, Any]], dt: float):
+        """
+        Applies contact and feeding interactions to the organisms' states (in place).
+
+        Organisms on the same food patch ask for the same bite (consumption_rate * dt). When the
+        patch holds less than they ask for together, it is split in proportion to demand, i.e.
+        equally, so no organism is favoured by its ID or by the order in which
+        organisms were stepped. 'local_food' is the amount left on the patch after everyone
+        has eaten.
+        """
+        self.spatial_hash.rebuild({oid: state['position'] for oid, state in organism_states.items()})
+        max_bite = self.consumption_rate * dt
+        patches: Dict[str, Tuple[int, int]] = {}
+        diners: Dict[Tuple[int, int], int] = defaultdict(int) # Patch -> number of organisms on it
+        for oid, state in organism_states.items():
+            state['contacts'] = self.spatial_hash.neighbors(oid, self.contact_radius)
+            patch = patches[oid] = self.food_cell_of(state['position'])
+            diners[patch] += 1
+
+        bites: Dict[Tuple[int, int], float] = {}
+        for patch, count in diners.items():
+            available = self.food.get(patch, 0.0)
+            if available <= 0.0:
+                continue
+            if count * max_bite < available:
+                bites[patch] = max_bite
+                self.food[patch] = available - count * max_bite
+            else:
+                bites[patch] = available / count
+                del self.food[patch] # Eaten out; keep the food grid sparse
+
+        for oid, patch in patches.items():
+            state = organism_states[oid]
+            state['food_eaten'] = state.get('food_eaten', 0.0) + bites.get(patch, 0.0)
+            state['local_food'] = self.food.get(patch, 0.0)
+
+    def get_state(self) -> Dict[str, Any]:
+        """Returns a summary of the arena (for logging)."""
+        return {"food_patches": len(self.food), "total_food": sum(self.food.values())}
@@ -0,0 +1,195 @@
+# mict/boundary_recording.py
+import json
+import os
+import struct
+import sys
+from array import array
+from typing import Dict, Any, Optional, List, Sequence, Tuple, Iterator
+
+from .cell_cycle import CellMICT
+from .component_cycle import ComponentMICT
+
+# --- Stream Format ---
+# MAGIC | uint32 header length | JSON header | frames
+# Each frame holds one value per channel, little-endian, of the header's dtype ('f' or 'd').
+MAGIC = b"MICTBND1"
+_HEADER_LEN = struct.Struct("<I")
+
+
+class BoundaryRecorder:
+    """
+    Captures the signals crossing a subsystem boundary into a compact on-disk stream.
+
+    Each channel reads one state key of one upstream cell, e.g. the 'output_signal' of a motor
+    neuron feeding a muscle group. Call `capture()` once per step of the upstream simulation.
+
+    Args:
+        path (str): File to write the stream to.
+        sources (Dict[str, Tuple[CellMICT, str]]): channel name -> (upstream cell, state key).
+        dtype (str): 'd' (float64, default), which replays recorded values exactly, or 'f'
+            (float32), which halves the file size but rounds every value (0.1 replays as
+            0.10000000149011612).
+        metadata (Optional[Dict[str, Any]]): Extra JSON-serialisable information stored in the header.
+        flush_every (int): Number of frames buffered in memory between writes.
+    """
+    def __init__(self, path: str, sources: Dict[str, Tuple[CellMICT, str]], dtype: str = "d",
+                 metadata: Optional[Dict[str, Any]] = None, flush_every: int = 1024):
+        if dtype not in ("f", "d"):
+            raise ValueError(f"dtype must be 'f' or 'd', got {dtype!r}")
+        self.path = path
+        self.sources = sources
+        self.channels = list(sources)
+        self.dtype = dtype
+        self.flush_every = flush_every
+        self.frames_written = 0
+        self._buffer = array(dtype)
+        self._buffered_frames = 0
+
+        header = json.dumps({"channels": self.channels, "dtype": dtype, "metadata": metadata or {}}).encode("utf-8")
+        self._file = open(path, "wb")
+        self._file.write(MAGIC + _HEADER_LEN.pack(len(header)) + header)
+
+    def capture(self):
+        """Records the current value of every source channel as one frame."""
+        self.write_frame([cell.get_state().get(key, 0.0) for cell, key in self.sources.values()])
+
+    def write_frame(self, values: Sequence[float]):
+        """Records one frame of values, in channel order."""
+        if len(values) != len(self.channels):
+            raise ValueError(f"Expected {len(self.channels)} values, got {len(values)}")
+        self._buffer.extend(float(v) for v in values)
+        self._buffered_frames += 1
+        if self._buffered_frames >= self.flush_every:
+            self.flush()
+
+    def flush(self):
+        """Writes buffered frames to disk."""
+        if not self._buffer:
+            return
+        if sys.byteorder != "little":
+            self._buffer.byteswap()
+        self._file.write(self._buffer.tobytes())
+        self.frames_written += self._buffered_frames
+        self._buffer = array(self.dtype)
+        self._buffered_frames = 0
+
+    def close(self):
+        """Flushes and closes the stream."""
+        if not self._file.closed:
+            self.flush()
+            self._file.close()
+
+    def __enter__(self) -> "BoundaryRecorder":
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+class BoundaryStream:
+    """
+    Reads a stream written by BoundaryRecorder.
+
+    Args:
+        path (str): The stream file.
+    """
+    def __init__(self, path: str):
+        self.path = path
+        with open(path, "rb") as f:
+            if f.read(len(MAGIC)) != MAGIC:
+                raise ValueError(f"{path} is not a boundary signal stream")
+            (header_len,) = _HEADER_LEN.unpack(f.read(_HEADER_LEN.size))
+            header = json.loads(f.read(header_len).decode("utf-8"))
+        self.channels: List[str] = header["channels"]
+        self.dtype: str = header["dtype"]
+        self.metadata: Dict[str, Any] = header["metadata"]
+        self._data_offset = len(MAGIC) + _HEADER_LEN.size + header_len
+        self._frame_bytes = array(self.dtype).itemsize * len(self.channels)
+
+    def __len__(self) -> int:
+        if not self._frame_bytes:
+            return 0
+        return (os.path.getsize(self.path) - self._data_offset) // self._frame_bytes
+
+    def _decode(self, raw: bytes) -> array:
+        values = array(self.dtype)
+        values.frombytes(raw)
+        if sys.byteorder != "little":
+            values.byteswap()
+        return values
+
+    def frame(self, index: int) -> Tuple[float, ...]:
+        """Returns one frame (random access). Negative indices count from the end."""
+        n_frames = len(self)
+        position = index + n_frames if index < 0 else index
+        if not 0 <= position < n_frames:
+            raise IndexError(f"Frame {index} out of range for a stream of {n_frames} frames")
+        with open(self.path, "rb") as f:
+            f.seek(self._data_offset + position * self._frame_bytes)
+            raw = f.read(self._frame_bytes)
+        return tuple(self._decode(raw))
+
+    def __iter__(self) -> Iterator[Tuple[float, ...]]:
+        n = len(self.channels)
+        chunk_frames = 1024
+        with open(self.path, "rb") as f:
+            f.seek(self._data_offset)
+            while True:
+                raw = f.read(self._frame_bytes * chunk_frames)
+                usable = len(raw) - len(raw) % self._frame_bytes if self._frame_bytes else 0
+                if not usable:
+                    return
+                values = self._decode(raw[:usable])
+                for start in range(0, len(values), n):
+                    yield tuple(values[start:start + n])
+
+
+class BoundaryReplay:
+    """
+    Drives a downstream subtree (a SystemMICT or ComponentMICT) from a recorded boundary stream.
+
+    The upstream levels that produced the stream are not needed: only the subtree being tuned
+    is instantiated and stepped. Every frame is delivered to the target cells through
+    `ComponentMICT.deliver_input`, which only wakes a quiescent component when the value in
+    the cell's state actually changes (including when the cell consumed its previous input).
+
+    Args:
+        stream (BoundaryStream): The recorded stream.
+        subtree (Any): Object with a `step()` method (SystemMICT or ComponentMICT) to drive.
+        targets (Dict[str, Tuple[ComponentMICT, str, str]]): channel name -> (component, cell ID, state key).
+            Channels without a target are ignored.
+        steps_per_frame (int): Number of `subtree.step()` calls per recorded frame.
+    """
+    def __init__(self, stream: BoundaryStream, subtree: Any,
+                 targets: Dict[str, Tuple[ComponentMICT, str, str]], steps_per_frame: int = 1):
+        missing = [channel for channel in targets if channel not in stream.channels]
+        if missing:
+            raise ValueError(f"Channels not in stream: {missing}")
+        self.stream = stream
+        self.subtree = subtree
+        self.steps_per_frame = steps_per_frame
+        self.frames_replayed = 0
+        # (position in frame, component, cell ID, key) for each bound channel
+        self._bindings = [
+            (stream.channels.index(channel), component, cell_id, key)
+            for channel, (component, cell_id, key) in targets.items()
+        ]
+        self._frames = iter(stream)
+
+    def run(self, n_frames: Optional[int] = None) -> int:
+        """Replays the next `n_frames` frames (all remaining by default). Returns the number replayed."""
+        replayed = 0
+        while n_frames is None or replayed < n_frames:
+            frame = next(self._frames, None)
+            if frame is None:
+                break
+            self._deliver(frame)
+            for _ in range(self.steps_per_frame):
+                self.subtree.step()
+            replayed += 1
+        self.frames_replayed += replayed
+        return replayed
+
+    def _deliver(self, frame: Sequence[float]):
+        for position, component, cell_id, key in self._bindings:
+            component.deliver_input(cell_id, key, frame[position])
@@ -1,6 +1,10 @@
 # mict/cell_cycle.py
 from .mict_framework import MICT
-from typing import Dict, Any, Optional, List
+from typing import Dict, Any, Optional, List, Callable
+
+# State keys through which a cell receives input. A cell with a nonzero value under any of
+# these keys is considered driven, and will not be treated as quiescent.
+INPUT_KEYS = ("inputs", "received_signals", "synaptic_input", "input_current", "input_signal")
 
 class CellMICT:
     """
@@ -11,11 +15,16 @@ class CellMICT:
         cell_type (str): The type of cell (e.g., 'neuron', 'muscle').
         initial_state (Dict[str, Any]): The initial state of the cell.
         neighbor_cells (List[str]): List of IDs of connected cells (for interaction).
+        idle_advance (Optional[Callable[[Dict, int], Dict]]): Closed-form update applied when the cell
+            resumes after `n` skipped (quiescent) cycles. Defaults to leaving the state unchanged,
+            which is exact for a cell sitting at its steady state.
     """
-    def __init__(self, cell_id: str, cell_type: str, initial_state: Dict[str, Any], neighbor_cells: Optional[List[str]] = None):
+    def __init__(self, cell_id: str, cell_type: str, initial_state: Dict[str, Any], neighbor_cells: Optional[List[str]] = None,
+                 idle_advance: Optional[Callable[[Dict, int], Dict]] = None):
         self.cell_id = cell_id
         self.cell_type = cell_type
         self.neighbor_cells = neighbor_cells if neighbor_cells is not None else []
+        self.idle_advance = idle_advance
 
         # --- Define MICT Stage Functions for a Cell ---
         def mapping(state: Dict) -> Dict:
@@ -50,7 +59,7 @@ class CellMICT:
             # TODO: Implement state updates based on Checking. Prepare outputs for neighbors.
             # Example: if state.get('fired'): state['output_signal'] = generate_action_potential()
             # Example (Learning/Plasticity): Adjust internal parameters based on activity history.
-            # state['synaptic_strength'] = adapt_synapses(state['activity_history'])
+            # Synaptic weights are adapted per component (see ComponentMICT's `plasticity`), from spike traces.
             state.pop('inputs', None) # Clean up temporary inputs for next cycle
             return state
 
@@ -70,6 +79,7 @@ class CellMICT:
 
         self.engine = MICT(config)
         self.currentState = self.engine.currentState # Convenience access
+        self.cycle_length = len(config["stages"]) # Steps per full MICT cycle
 
     def _update_state(self, new_state: Dict, stage: str):
         """Internal method called by MICT to update the component's state."""
@@ -90,3 +100,29 @@ class CellMICT:
     def get_state(self) -> Dict:
         """Returns the current state of the cell."""
         return self.currentState
+
+    # --- Quiescence Support (used by ComponentMICT) ---
+
+    def has_input(self) -> bool:
+        """Returns True if any input key in the current state carries a nonzero value."""
+        for key in INPUT_KEYS:
+            value = self.currentState.get(key)
+            if isinstance(value, dict):
+                if any(value.values()):
+                    return True
+            elif value:
+                return True
+        return False
+
+    def rest_signature(self) -> tuple:
+        """Returns the scalar state variables, used to detect that the cell is no longer changing."""
+        return tuple(sorted(
+            (key, value) for key, value in self.currentState.items()
+            if isinstance(value, (int, float, bool, str))
+        ))
+
+    def advance_idle(self, n_cycles: int):
+        """Advances the state in closed form over `n_cycles` skipped cycles."""
+        if self.idle_advance is not None and n_cycles > 0:
+            # Update in place so the engine keeps sharing the same state dict
+            self.currentState.update(self.idle_advance(dict(self.currentState), n_cycles))
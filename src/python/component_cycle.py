@@ -1,6 +1,7 @@
 # mict/component_cycle.py
 from .mict_framework import MICT
 from .cell_cycle import CellMICT # Assuming CellMICT is in the same directory
+from .plasticity import STDPPlasticity
 from typing import Dict, Any, Optional, List
 
 class ComponentMICT:
@@ -13,11 +14,29 @@ class ComponentMICT:
         component_type (str): The type of component (e.g., 'neural_circuit', 'muscle_group').
         initial_state (Dict[str, Any]): Initial state specific to the component level.
         sub_cycles (List[CellMICT]): A list of the cell-level MICT cycles managed by this component.
+        quiescence (bool): If True, the component stops stepping its cells once they have all been
+            at steady state with zero input for a full cell cycle, until woken by `deliver_input` or `wake`.
+        plasticity (Optional[STDPPlasticity]): Adapts the component's synaptic weights once per full cell
+            cycle (after the cells' Transformation) from the cells whose 'output_signal' is nonzero.
     """
-    def __init__(self, component_id: str, component_type: str, initial_state: Dict[str, Any], sub_cycles: List[CellMICT]):
+    def __init__(self, component_id: str, component_type: str, initial_state: Dict[str, Any], sub_cycles: List[CellMICT],
+                 quiescence: bool = False, plasticity: Optional[STDPPlasticity] = None):
         self.component_id = component_id
         self.component_type = component_type
         self.sub_cycles = sub_cycles # Store references to the cell cycles
+        self.plasticity = plasticity
+        self._cells_by_id = {cell.cell_id: cell for cell in sub_cycles}
+
+        # --- Quiescence Tracking ---
+        self.quiescence = quiescence
+        self.parent = None # Set by the owning SystemMICT; woken together with this component
+        self.quiescent = False
+        self.executed_steps = 0
+        self.skipped_steps = 0
+        self._dirty = False # Input arrived since the last quiescence check
+        self._tick = 0 # Steps taken (executed or skipped) since creation
+        self._idle_steps = 0 # Steps skipped since becoming quiescent
+        self._last_signature = None
 
         # --- Define MICT Stage Functions for a Component ---
         def mapping(state: Dict) -> Dict:
@@ -57,9 +76,8 @@ class ComponentMICT:
         def transformation(state: Dict) -> Dict:
             """Adapts component properties (e.g., connections) or sends output."""
             print(f"Component {self.component_id} - Transformation: Adapting component...")
-            # TODO: Implement adaptation logic (e.g., Hebbian learning for synapses).
+            # Synaptic weights (STDP / Hebbian) are adapted once per full cell cycle, see step().
             # TODO: Prepare and send output signals to other components or higher levels.
-            # state['connections'] = adapt_connections(state)
             # send_output_to_neighbors(state['output'])
             return state
 
@@ -79,6 +97,11 @@ class ComponentMICT:
 
         self.engine = MICT(config)
         self.currentState = self.engine.currentState
+        self.cycle_length = len(config["stages"])
+        # Cells advance one stage per component cycle, so a full cell cycle spans this many steps.
+        # Quiescence is only entered or left on these boundaries, keeping every engine in phase.
+        cell_cycle_length = sub_cycles[0].cycle_length if sub_cycles else 1
+        self._period = self.cycle_length * cell_cycle_length
 
     def _update_state(self, new_state: Dict, stage: str):
         self.currentState = new_state
@@ -89,8 +112,78 @@ class ComponentMICT:
         # TODO: Implement error handling
 
     def step(self):
-        """Advances the component's MICT cycle by one step."""
+        """Advances the component's MICT cycle by one step (or skips it while quiescent)."""
+        if self.quiescent:
+            if self._dirty and self._tick % self._period == 0:
+                self._resume()
+            else:
+                self._skip(1)
+                return
         self.engine.next_stage()
+        self.executed_steps += 1
+        self._tick += 1
+        if self._tick % self._period == 0:
+            # Every cell has just completed a full cycle (ending in its Transformation)
+            if self.plasticity is not None:
+                self.plasticity.step_ids(
+                    cell.cell_id for cell in self.sub_cycles if cell.get_state().get('output_signal')
+                )
+            if self.quiescence:
+                self._check_quiescence()
+
+    # --- Quiescence ---
+
+    def wake(self):
+        """Marks the component (and its parents) dirty so it resumes at the next cycle boundary."""
+        self._dirty = True
+        if self.parent is not None:
+            self.parent.wake()
+
+    def is_idle(self) -> bool:
+        """Returns True if the component is quiescent and has no pending input."""
+        return self.quiescent and not self._dirty
+
+    def deliver_input(self, cell_id: str, key: str, value: Any):
+        """Sets an input on one of the component's cells, waking the component if the value changed."""
+        state = self._cells_by_id[cell_id].currentState
+        if key in state and state[key] == value:
+            return
+        state[key] = value
+        self.wake()
+
+    def _skip(self, n_steps: int):
+        """Accounts for `n_steps` steps that were not executed."""
+        self._tick += n_steps
+        self._idle_steps += n_steps
+        self.skipped_steps += n_steps
+
+    def _check_quiescence(self):
+        """Called on cell-cycle boundaries: goes quiescent if no cell changed or received input."""
+        signature = tuple(cell.rest_signature() for cell in self.sub_cycles)
+        at_rest = (not self._dirty
+                   and signature == self._last_signature
+                   and not any(cell.has_input() for cell in self.sub_cycles))
+        self._last_signature = signature
+        self._dirty = False
+        if at_rest:
+            self.quiescent = True
+            self._idle_steps = 0
+
+    def _resume(self):
+        """Leaves quiescence, advancing cells in closed form over the skipped cycles."""
+        n_cycles = self._idle_steps // self._period
+        for cell_cycle in self.sub_cycles:
+            cell_cycle.advance_idle(n_cycles)
+        if self.plasticity is not None:
+            self.plasticity.skip(n_cycles) # So traces decay over the idle period
+        self.quiescent = False
+        self._idle_steps = 0
+        self._last_signature = None
+
+    def get_work_counters(self) -> Dict[str, Any]:
+        """Returns how many steps were executed and skipped."""
+        return {"executed_steps": self.executed_steps, "skipped_steps": self.skipped_steps,
+                "quiescent": self.quiescent}
 
     def get_state(self) -> Dict:
         """Returns the current state of the component."""
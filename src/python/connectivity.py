@@ -0,0 +1,76 @@
+# mict/connectivity.py
+from array import array
+from typing import Dict, List, Sequence, Tuple
+
+# A weighted connection is (pre-synaptic cell ID, post-synaptic cell ID, weight).
+Connection = Tuple[str, str, float]
+
+
+class SparseWeights:
+    """
+    Sparse synaptic weight matrix in compressed-row form (rows are post-synaptic cells).
+
+    Only existing synapses are stored. Besides the row index (incoming synapses of each cell),
+    an index of outgoing synapses per pre-synaptic cell is kept, so both sides of a spike can
+    be visited without scanning the matrix.
+
+    Args:
+        cell_ids (List[str]): The cells, in the order used for indices.
+        connections (List[Tuple[str, str, float]]): (pre_id, post_id, weight) entries.
+    """
+    def __init__(self, cell_ids: List[str], connections: Sequence[Connection]):
+        self.cell_ids = list(cell_ids)
+        self.index_of = {cell_id: i for i, cell_id in enumerate(self.cell_ids)}
+        n = len(self.cell_ids)
+
+        rows: List[List[Tuple[int, float]]] = [[] for _ in range(n)]
+        for pre_id, post_id, weight in connections:
+            rows[self.index_of[post_id]].append((self.index_of[pre_id], weight))
+
+        # --- CSR Arrays ---
+        self.row_ptr = array("l", [0])
+        self.pre_index = array("l")
+        self.data = array("d")
+        for row in rows:
+            for pre, weight in sorted(row):
+                self.pre_index.append(pre)
+                self.data.append(weight)
+            self.row_ptr.append(len(self.data))
+
+        # --- Outgoing Index: data positions of each pre-synaptic cell's synapses ---
+        self.post_index = array("l", bytes(self.pre_index.itemsize * len(self.data)))
+        self.outgoing: List[array] = [array("l") for _ in range(n)]
+        for post in range(n):
+            for k in range(self.row_ptr[post], self.row_ptr[post + 1]):
+                self.post_index[k] = post
+                self.outgoing[self.pre_index[k]].append(k)
+
+    def __len__(self) -> int:
+        return len(self.data)
+
+    def get(self, pre_id: str, post_id: str) -> float:
+        """Returns the weight of one synapse (0.0 if it does not exist)."""
+        pre, post = self.index_of[pre_id], self.index_of[post_id]
+        for k in range(self.row_ptr[post], self.row_ptr[post + 1]):
+            if self.pre_index[k] == pre:
+                return self.data[k]
+        return 0.0
+
+    def synaptic_input(self, outputs: Sequence[float]) -> List[float]:
+        """Returns the weighted input to every cell given the outputs of all cells."""
+        result = [0.0] * len(self.cell_ids)
+        for pre, value in enumerate(outputs):
+            if value:
+                for k in self.outgoing[pre]:
+                    result[self.post_index[k]] += self.data[k] * value
+        return result
+
+    def to_dict(self) -> Dict[str, Dict[str, float]]:
+        """Returns the weights as {post_id: {pre_id: weight}}."""
+        return {
+            self.cell_ids[post]: {
+                self.cell_ids[self.pre_index[k]]: self.data[k]
+                for k in range(self.row_ptr[post], self.row_ptr[post + 1])
+            }
+            for post in range(len(self.cell_ids))
+        }
@@ -0,0 +1,136 @@
+# mict/noise.py
+import hashlib
+import math
+import struct
+from typing import Dict, Any, List, Iterable, Tuple
+
+# --- Counter Layout ---
+# Each block of 128 random bits is BLAKE2b (keyed by the seed) of a 128-bit counter:
+# step, replica, stream, method | block, then the cell index last, so a population shares
+# one hashed prefix and only the cell index is fed per cell.
+_SHARED = struct.Struct("<IIHH")
+_CELL = struct.Struct("<I")
+_WORDS = struct.Struct("<4I")
+_TWO_POW_32 = 4294967296.0
+_TWO_PI = 2.0 * math.pi
+
+# Method bit of the fourth counter word, keeping uniform and Gaussian draws on separate counters
+_UNIFORM = 0
+_NORMAL = 1 << 15
+_N_BLOCKS = 1 << 15
+
+
+def _check_range(name: str, value: int, limit: int):
+    if not 0 <= value < limit:
+        raise ValueError(f"{name} must be in [0, {limit}), got {value}")
+
+
+class CounterNoise:
+    """
+    Reproducible noise source for cell models, keyed by (seed, replica, cell index, step).
+
+    Every value is a pure function of its key, so results are bit-identical regardless of
+    how cells are partitioned across processes, how many threads are used, or the order in
+    which cells are stepped. There is no generator state to share or advance.
+
+    The generator is counter-based: 128 random bits are the keyed BLAKE2b hash of a 128-bit
+    counter, computed by `hashlib` in C. For example:
+
+    >>> noise = CounterNoise(seed=42)
+    >>> noise.uniform(3, 100) == CounterNoise(seed=42).population_uniform(100, [7, 3])[1]
+    True
+
+    Each (cell, step) pair owns a stream of draws: `draw` selects which one, so a model that
+    needs several independent terms per step from one source uses draw=0, 1, ... Uniform and
+    Gaussian draws come from separate counters, so `uniform(c, s, 0)` and `normal(c, s, 0)` are
+    independent of each other.
+
+    Cell indices and steps are 32-bit counter words, and each (cell, step) pair has 2**17
+    uniform and 2**16 Gaussian draws. Values outside these ranges raise ValueError instead of
+    silently wrapping onto another counter.
+
+    Args:
+        seed (int): Global seed (up to 64 bits).
+        replica (int): Replica / trial index (up to 32 bits), giving independent runs of the same model.
+        stream (int): Noise source index (up to 16 bits), e.g. 0 for channel noise, 1 for synaptic noise.
+    """
+    def __init__(self, seed: int, replica: int = 0, stream: int = 0):
+        _check_range("seed", seed, 1 << 64)
+        _check_range("replica", replica, 1 << 32)
+        _check_range("stream", stream, 1 << 16)
+        self.seed = seed
+        self.replica = replica
+        self.stream = stream
+        self._key = seed.to_bytes(8, "little")
+
+    def _prefix(self, step: int, method: int, block: int) -> "hashlib.blake2b":
+        # Hash state after the words shared by every cell: (step, replica, stream, method | block)
+        _check_range("step", step, 1 << 32)
+        shared = _SHARED.pack(step, self.replica, self.stream, method | block)
+        return hashlib.blake2b(shared, key=self._key, digest_size=16)
+
+    def _block(self, cell_index: int, step: int, method: int, block: int) -> Tuple[int, int, int, int]:
+        _check_range("cell_index", cell_index, 1 << 32)
+        h = self._prefix(step, method, block)
+        h.update(_CELL.pack(cell_index))
+        return _WORDS.unpack(h.digest())
+
+    def uniform(self, cell_index: int, step: int, draw: int = 0) -> float:
+        """Returns a uniform sample in the open interval (0, 1)."""
+        _check_range("draw", draw, 4 * _N_BLOCKS)
+        word = self._block(cell_index, step, _UNIFORM, draw >> 2)[draw & 3]
+        return (word + 0.5) / _TWO_POW_32
+
+    def normal(self, cell_index: int, step: int, draw: int = 0, mean: float = 0.0, std: float = 1.0) -> float:
+        """Returns a Gaussian sample (Box-Muller on one pair of 32-bit words)."""
+        _check_range("draw", draw, 2 * _N_BLOCKS)
+        words = self._block(cell_index, step, _NORMAL, draw >> 1)
+        i = (draw & 1) << 1
+        return mean + std * _box_muller(words[i], words[i + 1])
+
+    # --- Population Vectors ---
+    # The shared counter prefix is hashed once; each cell then costs one copy of the hash state,
+    # one update and one digest, all in C.
+
+    def _population_blocks(self, step: int, cell_indices: Iterable[int], method: int,
+                           block: int) -> List[Tuple[int, int, int, int]]:
+        cell_indices = list(cell_indices)
+        if cell_indices:
+            _check_range("cell_index", min(cell_indices), 1 << 32)
+            _check_range("cell_index", max(cell_indices), 1 << 32)
+        prefix = self._prefix(step, method, block)
+        pack, unpack = _CELL.pack, _WORDS.unpack
+        blocks = []
+        for cell_index in cell_indices:
+            h = prefix.copy()
+            h.update(pack(cell_index))
+            blocks.append(unpack(h.digest()))
+        return blocks
+
+    def population_uniform(self, step: int, cell_indices: Iterable[int], draw: int = 0) -> List[float]:
+        """Returns one uniform sample per cell for the given step, in the order of `cell_indices`."""
+        _check_range("draw", draw, 4 * _N_BLOCKS)
+        word = draw & 3
+        return [(words[word] + 0.5) / _TWO_POW_32 for words in self._population_blocks(step, cell_indices, _UNIFORM, draw >> 2)]
+
+    def population_normal(self, step: int, cell_indices: Iterable[int], draw: int = 0,
+                          mean: float = 0.0, std: float = 1.0) -> List[float]:
+        """Returns one Gaussian sample per cell for the given step, in the order of `cell_indices`."""
+        _check_range("draw", draw, 2 * _N_BLOCKS)
+        i = (draw & 1) << 1
+        sqrt, log, cos = math.sqrt, math.log, math.cos
+        scale = 1.0 / _TWO_POW_32
+        return [
+            mean + std * sqrt(-2.0 * log((words[i] + 0.5) * scale)) * cos(_TWO_PI * words[i + 1] * scale)
+            for words in self._population_blocks(step, cell_indices, _NORMAL, draw >> 1)
+        ]
+
+    def get_state(self) -> Dict[str, Any]:
+        """Returns everything needed to recreate this noise source (e.g., in a worker process)."""
+        return {"seed": self.seed, "replica": self.replica, "stream": self.stream}
+
+
+def _box_muller(w0: int, w1: int) -> float:
+    u1 = (w0 + 0.5) / _TWO_POW_32 # In (0, 1), so log() is always finite
+    u2 = w1 / _TWO_POW_32
+    return math.sqrt(-2.0 * math.log(u1)) * math.cos(_TWO_PI * u2)
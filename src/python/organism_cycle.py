@@ -98,3 +98,7 @@ class OrganismMICT:
     def get_state(self) -> Dict:
         """Returns the current state of the organism."""
         return self.currentState
+
+    def get_work_counters(self) -> Dict[str, Any]:
+        """Returns executed/skipped step counts for every system and component (see quiescence)."""
+        return {sys_cycle.system_id: sys_cycle.get_work_counters() for sys_cycle in self.system_cycles}
@@ -0,0 +1,338 @@
+# mict/parameter_fitting.py
+import hashlib
+import json
+import os
+import pickle
+import random
+import tempfile
+from collections import OrderedDict
+from concurrent.futures import Executor, ProcessPoolExecutor
+from itertools import product
+from typing import Dict, Any, Optional, List, Callable, Sequence, Tuple
+
+# A candidate is a flat mapping of parameter name -> value, e.g. {'R_M': 10.0, 'TAU_M': 10.0}.
+Params = Dict[str, float]
+Bounds = Dict[str, Tuple[float, float]]
+
+_MISSING = object() # Cache miss sentinel (a cached result may itself be None)
+
+
+def simulation_key(structure: Any, params: Params, stimulus: Any, duration: float) -> str:
+    """
+    Returns a content hash identifying one simulation run.
+
+    Two runs share a key exactly when the model structure, the parameter vector,
+    the stimulus and the duration all serialise to the same canonical JSON. Values that
+    are not JSON-serialisable raise TypeError rather than being hashed by repr(), whose
+    output can vary between runs or elide data. Numeric parameter values are hashed as
+    floats, so {'R_M': 1} and {'R_M': 1.0} share a key.
+
+    Args:
+        structure (Any): JSON-serialisable description of the model (connectome, cell types, ...).
+        params (Dict[str, float]): The parameter vector being evaluated.
+        stimulus (Any): JSON-serialisable description of the stimulus protocol.
+        duration (float): Simulated duration of the run.
+    """
+    params = {
+        name: float(value) if isinstance(value, (int, float)) and not isinstance(value, bool) else value
+        for name, value in params.items()
+    }
+    payload = json.dumps(
+        {"structure": structure, "params": params, "stimulus": stimulus, "duration": duration},
+        sort_keys=True, separators=(",", ":")
+    )
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+class SimulationCache:
+    """
+    On-disk, content-addressed store of simulation outputs with LRU eviction.
+
+    Each result is pickled to `<cache_dir>/<key[:2]>/<key>.pkl`. File modification
+    times record the last use, so the LRU order survives across processes and runs.
+    When the total size exceeds `max_bytes`, the least recently used entries are removed.
+
+    Args:
+        cache_dir (str): Directory holding the cached results (created if missing).
+        max_bytes (int): Upper bound on the total size of cached results.
+    """
+    def __init__(self, cache_dir: str, max_bytes: int = 512 * 1024 * 1024):
+        self.cache_dir = cache_dir
+        self.max_bytes = max_bytes
+        self.total_bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self._index: "OrderedDict[str, int]" = OrderedDict() # key -> size, oldest first
+        os.makedirs(cache_dir, exist_ok=True)
+        self._load_index()
+
+    def _path(self, key: str) -> str:
+        return os.path.join(self.cache_dir, key[:2], key + ".pkl")
+
+    def _load_index(self):
+        """Rebuilds the in-memory LRU index from the files already on disk."""
+        entries = []
+        for root, _, files in os.walk(self.cache_dir):
+            for name in files:
+                if not name.endswith(".pkl"):
+                    continue
+                stat = os.stat(os.path.join(root, name))
+                entries.append((stat.st_mtime, name[:-4], stat.st_size))
+        for _, key, size in sorted(entries):
+            self._index[key] = size
+            self.total_bytes += size
+
+    def __contains__(self, key: str) -> bool:
+        return key in self._index
+
+    def __len__(self) -> int:
+        return len(self._index)
+
+    def get(self, key: str, default: Any = None) -> Any:
+        """Returns the cached result for `key`, or `default` if it is not cached."""
+        if key not in self._index:
+            self.misses += 1
+            return default
+        path = self._path(key)
+        try:
+            with open(path, "rb") as f:
+                value = pickle.load(f)
+            os.utime(path) # Mark as most recently used
+        except (OSError, pickle.UnpicklingError, EOFError):
+            # Entry vanished or is corrupt; forget it and report a miss
+            self._forget(key)
+            self.misses += 1
+            return default
+        self._index.move_to_end(key)
+        self.hits += 1
+        return value
+
+    def put(self, key: str, value: Any):
+        """Stores `value` under `key`, then evicts old entries if over budget."""
+        path = self._path(key)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        # Write to a temporary file first so readers never see a partial entry
+        fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(path), suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                pickle.dump(value, f, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(tmp_path, path)
+        except BaseException:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+            raise
+        if key in self._index:
+            self.total_bytes -= self._index.pop(key)
+        size = os.path.getsize(path)
+        self._index[key] = size
+        self.total_bytes += size
+        self._evict()
+
+    def _forget(self, key: str):
+        size = self._index.pop(key, None)
+        if size is not None:
+            self.total_bytes -= size
+
+    def _evict(self):
+        """Removes least recently used entries until the cache fits in `max_bytes`."""
+        while self.total_bytes > self.max_bytes and len(self._index) > 1:
+            key = next(iter(self._index))
+            try:
+                os.remove(self._path(key))
+            except OSError:
+                pass
+            self._forget(key)
+
+    def clear(self):
+        """Removes every cached result."""
+        for key in list(self._index):
+            try:
+                os.remove(self._path(key))
+            except OSError:
+                pass
+            self._forget(key)
+
+
+class ParameterFitter:
+    """
+    Fits model parameters (e.g., R_M, TAU_M, thresholds, synaptic weights) to data.
+
+    Candidates are simulated in parallel and their outputs memoised in a SimulationCache,
+    so repeated or overlapping evaluations (optimizer restarts, a tweaked objective)
+    are served from disk instead of being re-simulated. Scores are always recomputed
+    from the cached outputs, which keeps the cache valid when only the objective changes.
+    Lower scores are better.
+
+    Without an executor, worker processes are started once per search and reused by every
+    generation. Use the fitter as a context manager (`with fitter: ...`) to keep one pool
+    across several searches.
+
+    Args:
+        simulate (Callable): `simulate(params, stimulus, duration) -> result`. Must be picklable
+            (a module-level function) when running in worker processes.
+        objective (Callable): `objective(result, params) -> float` scoring one simulation output.
+        structure (Any): JSON-serialisable description of the model structure, used in the cache key.
+        stimulus (Any): JSON-serialisable stimulus protocol passed to every simulation.
+        duration (float): Simulated duration passed to every simulation.
+        cache (Optional[SimulationCache]): Result cache. If None, nothing is memoised across calls.
+        max_workers (Optional[int]): Worker processes used when no executor is given.
+        executor (Optional[Executor]): Executor to run simulations on (overrides max_workers).
+    """
+    def __init__(self, simulate: Callable[[Params, Any, float], Any],
+                 objective: Callable[[Any, Params], float],
+                 structure: Any, stimulus: Any, duration: float,
+                 cache: Optional[SimulationCache] = None,
+                 max_workers: Optional[int] = None,
+                 executor: Optional[Executor] = None):
+        self.simulate = simulate
+        self.objective = objective
+        self.structure = structure
+        self.stimulus = stimulus
+        self.duration = duration
+        self.cache = cache
+        self.max_workers = max_workers
+        self.executor = executor
+        self.simulations_run = 0
+        self.cache_hits = 0
+        self._pool: Optional[ProcessPoolExecutor] = None # Created lazily inside a `with` block
+        self._scopes = 0
+
+    def __enter__(self) -> "ParameterFitter":
+        self._scopes += 1
+        return self
+
+    def __exit__(self, *exc):
+        self._scopes -= 1
+        if not self._scopes and self._pool is not None:
+            self._pool.shutdown()
+            self._pool = None
+
+    def _key(self, params: Params) -> str:
+        return simulation_key(self.structure, params, self.stimulus, self.duration)
+
+    def run_candidates(self, candidates: Sequence[Params]) -> List[Any]:
+        """Returns the simulation output for each candidate, simulating only cache misses."""
+        keys = [self._key(params) for params in candidates]
+        results: Dict[str, Any] = {}
+        pending: Dict[str, Params] = {} # Unique misses, in first-seen order
+
+        for key, params in zip(keys, candidates):
+            if key in results or key in pending:
+                continue
+            cached = self.cache.get(key, _MISSING) if self.cache is not None else _MISSING
+            if cached is _MISSING:
+                pending[key] = params
+            else:
+                results[key] = cached
+                self.cache_hits += 1
+
+        if pending:
+            for key, result in zip(pending, self._simulate_all(list(pending.values()))):
+                results[key] = result
+                if self.cache is not None:
+                    self.cache.put(key, result)
+            self.simulations_run += len(pending)
+
+        return [results[key] for key in keys]
+
+    def _simulate_all(self, candidates: List[Params]) -> List[Any]:
+        if len(candidates) == 1 and self.executor is None:
+            return [self.simulate(candidates[0], self.stimulus, self.duration)]
+        n = len(candidates)
+        args = ([self.stimulus] * n, [self.duration] * n)
+        executor = self.executor or self._pool
+        if executor is None and self._scopes:
+            executor = self._pool = ProcessPoolExecutor(max_workers=self.max_workers)
+        if executor is not None:
+            return list(executor.map(self.simulate, candidates, *args))
+        with ProcessPoolExecutor(max_workers=self.max_workers) as pool:
+            return list(pool.map(self.simulate, candidates, *args))
+
+    def evaluate(self, candidates: Sequence[Params]) -> List[float]:
+        """Scores each candidate with the objective."""
+        results = self.run_candidates(candidates)
+        return [self.objective(result, params) for result, params in zip(results, candidates)]
+
+    # --- Search Strategies ---
+
+    def _summarise(self, candidates: List[Params], scores: List[float]) -> Dict[str, Any]:
+        best = min(range(len(scores)), key=scores.__getitem__)
+        return {
+            "best_params": candidates[best],
+            "best_score": scores[best],
+            "evaluations": list(zip(candidates, scores)),
+            "simulations_run": self.simulations_run,
+            "cache_hits": self.cache_hits,
+        }
+
+    def grid_search(self, grid: Dict[str, Sequence[float]]) -> Dict[str, Any]:
+        """Evaluates every combination of the given parameter values."""
+        if not grid or not all(grid.values()):
+            raise ValueError("grid must name at least one parameter, each with at least one value")
+        names = sorted(grid)
+        candidates = [dict(zip(names, values)) for values in product(*(grid[n] for n in names))]
+        with self:
+            scores = self.evaluate(candidates)
+        print(f"Fitting - Grid search: {len(candidates)} candidates, {self.cache_hits} cache hits")
+        return self._summarise(candidates, scores)
+
+    def random_search(self, bounds: Bounds, n_samples: int, seed: Optional[int] = None) -> Dict[str, Any]:
+        """Evaluates `n_samples` candidates drawn uniformly within `bounds`."""
+        if n_samples < 1:
+            raise ValueError(f"n_samples must be >= 1, got {n_samples}")
+        rng = random.Random(seed)
+        names = sorted(bounds)
+        candidates = [{n: rng.uniform(*bounds[n]) for n in names} for _ in range(n_samples)]
+        with self:
+            scores = self.evaluate(candidates)
+        print(f"Fitting - Random search: {len(candidates)} candidates, {self.cache_hits} cache hits")
+        return self._summarise(candidates, scores)
+
+    def evolutionary_search(self, bounds: Bounds, population_size: int = 20, generations: int = 10,
+                            elite_fraction: float = 0.25, mutation_scale: float = 0.1,
+                            seed: Optional[int] = None,
+                            initial_population: Optional[List[Params]] = None) -> Dict[str, Any]:
+        """
+        Simple (mu + lambda) evolutionary search.
+
+        Each generation keeps the best `elite_fraction` of the population and refills it with
+        Gaussian mutations of the elites (scaled by `mutation_scale` times each parameter's range),
+        clipped to `bounds`. Elites carry their scores forward, so only new children are evaluated,
+        and every candidate appears once in the returned evaluations.
+        """
+        if population_size < 1:
+            raise ValueError(f"population_size must be >= 1, got {population_size}")
+        if generations < 1:
+            raise ValueError(f"generations must be >= 1, got {generations}")
+        rng = random.Random(seed)
+        names = sorted(bounds)
+        population = list(initial_population or [])
+        while len(population) < population_size:
+            population.append({n: rng.uniform(*bounds[n]) for n in names})
+
+        n_elite = max(1, int(population_size * elite_fraction))
+        all_candidates: List[Params] = []
+        all_scores: List[float] = []
+        elites: List[Tuple[Params, float]] = []
+        with self:
+            for generation in range(generations):
+                scores = self.evaluate(population)
+                all_candidates.extend(population)
+                all_scores.extend(scores)
+                scored = elites + list(zip(population, scores))
+                scored.sort(key=lambda item: item[1])
+                print(f"Fitting - Generation {generation}: best score {scored[0][1]:.6g}, "
+                      f"{self.simulations_run} simulated, {self.cache_hits} cache hits")
+
+                elites = scored[:n_elite]
+                population = []
+                while len(elites) + len(population) < population_size:
+                    parent = rng.choice(elites)[0]
+                    child = {}
+                    for n in names:
+                        lo, hi = bounds[n]
+                        value = parent[n] + rng.gauss(0.0, mutation_scale * (hi - lo))
+                        child[n] = min(hi, max(lo, value))
+                    population.append(child)
+
+        return self._summarise(all_candidates, all_scores)
@@ -0,0 +1,122 @@
+# mict/plasticity.py
+import math
+from array import array
+from typing import Dict, Any, Optional, Iterable
+
+from .connectivity import SparseWeights
+
+
+class STDPPlasticity:
+    """
+    Trace-based spike-timing-dependent plasticity acting on a SparseWeights matrix.
+
+    Each cell keeps one exponentially decaying trace as a pre-synaptic cell and one as a
+    post-synaptic cell. Traces are decayed lazily (from the step of the last spike), so a step
+    only touches cells that spiked and the synapses attached to them:
+      * a post-synaptic spike potentiates its incoming synapses by a_plus * pre_trace;
+      * a pre-synaptic spike depresses its outgoing synapses by a_minus * post_trace
+        (or potentiates them, with rule='hebbian').
+    Weight changes are accumulated and applied every `update_interval` steps, then clipped
+    to [w_min, w_max] when bounds are given.
+
+    Args:
+        weights (SparseWeights): The weights to adapt (modified in place).
+        a_plus (float): Potentiation amplitude.
+        a_minus (float): Depression amplitude (potentiation amplitude for the Hebbian rule).
+        tau_plus (float): Pre-synaptic trace time constant (same time units as dt).
+        tau_minus (float): Post-synaptic trace time constant.
+        dt (float): Duration of one step, i.e. one full cell cycle (the cell model's DT).
+        w_min (Optional[float]): Lower weight bound.
+        w_max (Optional[float]): Upper weight bound.
+        update_interval (int): Number of steps between weight updates.
+        rule (str): 'stdp' (pair-based STDP) or 'hebbian' (coincidence-based potentiation only).
+    """
+    def __init__(self, weights: SparseWeights, a_plus: float = 0.01, a_minus: float = 0.012,
+                 tau_plus: float = 20.0, tau_minus: float = 20.0, dt: float = 0.1,
+                 w_min: Optional[float] = None, w_max: Optional[float] = None,
+                 update_interval: int = 1, rule: str = "stdp"):
+        if rule not in ("stdp", "hebbian"):
+            raise ValueError(f"Unknown plasticity rule: {rule!r}")
+        if update_interval < 1:
+            raise ValueError(f"update_interval must be >= 1, got {update_interval}")
+        self.weights = weights
+        self.a_plus = a_plus
+        self.a_minus = a_minus if rule == "stdp" else -a_minus # Sign flip turns depression into potentiation
+        self.decay_plus = math.exp(-dt / tau_plus)
+        self.decay_minus = math.exp(-dt / tau_minus)
+        self.w_min = w_min
+        self.w_max = w_max
+        self.update_interval = update_interval
+        self.rule = rule
+        self.step_count = 0
+
+        n = len(weights.cell_ids)
+        self._pre_trace = array("d", bytes(8 * n))
+        self._post_trace = array("d", bytes(8 * n))
+        self._last_spike = array("l", [0] * n) # Step at which each trace was last updated
+        self._pending: Dict[int, float] = {} # Data index -> accumulated weight change
+
+    def _trace(self, traces: array, decay: float, cell: int) -> float:
+        value = traces[cell]
+        if value:
+            value *= decay ** (self.step_count - self._last_spike[cell])
+        return value
+
+    def step(self, spiked: Iterable[int]):
+        """Applies plasticity for the cells (indices) that spiked in the current step."""
+        spiked = list(spiked)
+        if spiked:
+            w = self.weights
+            pending = self._pending
+            for post in spiked:
+                for k in range(w.row_ptr[post], w.row_ptr[post + 1]):
+                    trace = self._trace(self._pre_trace, self.decay_plus, w.pre_index[k])
+                    if trace:
+                        pending[k] = pending.get(k, 0.0) + self.a_plus * trace
+            for pre in spiked:
+                for k in w.outgoing[pre]:
+                    trace = self._trace(self._post_trace, self.decay_minus, w.post_index[k])
+                    if trace:
+                        pending[k] = pending.get(k, 0.0) - self.a_minus * trace
+
+            # Traces are bumped after the weight updates, so coincident spikes don't pair with themselves
+            for cell in spiked:
+                self._pre_trace[cell] = self._trace(self._pre_trace, self.decay_plus, cell) + 1.0
+                self._post_trace[cell] = self._trace(self._post_trace, self.decay_minus, cell) + 1.0
+                self._last_spike[cell] = self.step_count
+
+        self.step_count += 1
+        if self.step_count % self.update_interval == 0:
+            self.apply_pending()
+
+    def skip(self, n_steps: int):
+        """Advances the step counter over `n_steps` steps without spikes (e.g., while quiescent)."""
+        if n_steps <= 0:
+            return
+        intervals_before = self.step_count // self.update_interval
+        self.step_count += n_steps
+        if self.step_count // self.update_interval != intervals_before:
+            self.apply_pending()
+
+    def step_ids(self, spiked_ids: Iterable[str]):
+        """Same as `step`, with cell IDs instead of indices."""
+        index_of = self.weights.index_of
+        self.step(index_of[cell_id] for cell_id in spiked_ids)
+
+    def apply_pending(self):
+        """Applies the accumulated weight changes, clipping to the configured bounds."""
+        data = self.weights.data
+        w_min, w_max = self.w_min, self.w_max
+        for k, dw in self._pending.items():
+            value = data[k] + dw
+            if w_min is not None and value < w_min:
+                value = w_min
+            if w_max is not None and value > w_max:
+                value = w_max
+            data[k] = value
+        self._pending.clear()
+
+    def get_state(self) -> Dict[str, Any]:
+        """Returns a summary of the plasticity module (for logging)."""
+        return {"rule": self.rule, "step": self.step_count, "n_synapses": len(self.weights),
+                "pending_updates": len(self._pending)}
@@ -1,5 +1,8 @@
 # mict/simulation_manager.py
+import random
 import time
+from typing import Dict, Any, Optional, List, Tuple
+from .arena import Arena
 from .organism_cycle import OrganismMICT
 from .system_cycle import SystemMICT
 from .component_cycle import ComponentMICT
@@ -11,26 +14,37 @@ class SimulationManager:
     Manages the overall C. elegans simulation using hierarchical MICT cycles.
     """
     def __init__(self):
-        self.organism_cycle: Optional[OrganismMICT] = None
+        self.organism_cycle: Optional[OrganismMICT] = None # First organism (single-worm runs)
+        self.organisms: Dict[str, OrganismMICT] = {} # All organisms, stepped one after another
+        self.arena: Optional[Arena] = None # Shared environment (population runs)
+        self.connectome: Optional[Dict[str, Any]] = None # Cell data loaded once, read by every organism
         self.is_running = False
         self.simulation_time = 0.0
         self.steps_per_second = 100 # Example simulation speed
 
-    def initialize_simulation(self):
-        """Initializes the organism and its sub-cycles."""
-        print("Initializing Simulation...")
+    def _load_connectome(self) -> Dict[str, Any]:
+        """Loads the cell data shared by all organisms (loaded once per simulation)."""
+        # TODO: Load cell data (connectome, types, initial states) from OpenWorm data.
+        # Example:
+        # return {'neurons': load_neuron_data(), 'muscles': load_muscle_data()}
+        return {'neurons': [], 'muscles': []}
+
+    def _build_organism(self, organism_id: str, organism_initial_state: Dict[str, Any]) -> OrganismMICT:
+        """
+        Builds one organism from the shared connectome.
+
+        The connectome is loaded once and read here by reference, so the same neighbour lists
+        serve every organism. Everything else is built per organism: each one gets its own
+        cell, component and system cycle instances, and therefore its own state.
+        """
         # --- 1. Create Cell Cycles ---
-        # TODO: Load cell data (connectome, types, initial states) from OpenWorm data
-        #       and create CellMICT instances for each cell.
         neurons = []
         muscle_cells = []
         # Example:
-        # neuron_data = load_neuron_data()
-        # for data in neuron_data:
-        #     neurons.append(CellMICT(data['id'], 'neuron', data['initial_state'], data['neighbors']))
-        # muscle_data = load_muscle_data()
-        # for data in muscle_data:
-        #     muscle_cells.append(CellMICT(data['id'], 'muscle', data['initial_state'], data['neighbors']))
+        # for data in self.connectome['neurons']:
+        #     neurons.append(CellMICT(data['id'], 'neuron', dict(data['initial_state']), data['neighbors']))
+        # for data in self.connectome['muscles']:
+        #     muscle_cells.append(CellMICT(data['id'], 'muscle', dict(data['initial_state']), data['neighbors']))
 
         # --- 2. Create Component Cycles ---
         # TODO: Group cells into components (neural circuits, muscle groups) and create ComponentMICT instances.
@@ -46,16 +60,76 @@ class SimulationManager:
         system_cycles = [nervous_system, muscular_system] # Example list
 
         # --- 4. Create Organism Cycle ---
+        return OrganismMICT(organism_id, organism_initial_state, system_cycles)
+
+    def initialize_simulation(self):
+        """Initializes the organism and its sub-cycles."""
+        print("Initializing Simulation...")
+        self.connectome = self._load_connectome()
         # TODO: Define the organism's initial state (position, goals, etc.)
         organism_initial_state = {'position': (0, 0), 'velocity': (0, 0), 'hunger': 0.5} # Example
-        self.organism_cycle = OrganismMICT('worm1', organism_initial_state, system_cycles)
+        self.organism_cycle = self._build_organism('worm1', organism_initial_state)
+        self.organisms = {'worm1': self.organism_cycle}
+        self.arena = None
 
         self.simulation_time = 0.0
         print("Simulation Initialized.")
 
+    def initialize_population(self, n_worms: int, arena: Arena,
+                              positions: Optional[List[Tuple[float, float]]] = None,
+                              seed: Optional[int] = None):
+        """
+        Initializes a population of organisms sharing one arena.
+
+        The connectome is loaded once for all organisms; each organism then builds its own
+        cycle tree (see `_build_organism`).
+
+        Args:
+            n_worms (int): Number of organisms ('worm1' ... 'wormN').
+            arena (Arena): The shared environment (contacts, food).
+            positions (Optional[List[Tuple[float, float]]]): One starting position per organism. Random within the arena if None.
+            seed (Optional[int]): Seed for the random starting positions.
+        """
+        if positions is not None and len(positions) != n_worms:
+            raise ValueError(f"Expected {n_worms} starting positions, got {len(positions)}")
+        print(f"Initializing Population of {n_worms} Organisms...")
+        self.connectome = self._load_connectome()
+        if positions is None:
+            rng = random.Random(seed)
+            positions = [(rng.uniform(0, arena.width), rng.uniform(0, arena.height)) for _ in range(n_worms)]
+
+        self.organisms = {}
+        for i, position in enumerate(positions, start=1):
+            organism_initial_state = {'position': position, 'velocity': (0, 0), 'hunger': 0.5} # Example
+            organism_id = f'worm{i}'
+            self.organisms[organism_id] = self._build_organism(organism_id, organism_initial_state)
+        self.organism_cycle = self.organisms.get('worm1')
+        self.arena = arena
+
+        self.simulation_time = 0.0
+        print("Population Initialized.")
+
+    def run_simulation_step(self):
+        """Steps each organism in turn, then applies the interactions between them."""
+        # --- Run one step of each top-level organism cycle ---
+        # This will recursively step through all sub-cycles (system, component, cell)
+        for organism in self.organisms.values():
+            organism.run_simulation_step()
+
+        # --- Inter-organism interactions (contacts, food depletion) ---
+        dt = 1.0 / self.steps_per_second
+        if self.arena is not None:
+            self.arena.step({oid: organism.get_state() for oid, organism in self.organisms.items()}, dt)
+
+        # --- Update simulation time ---
+        # Note: The actual time represented by a step depends on the 'dt' used
+        #       within the iteration stages of the sub-cycles.
+        #       This is simplified for the template.
+        self.simulation_time += dt
+
     def run_simulation(self):
         """Runs the main simulation loop."""
-        if not self.organism_cycle:
+        if not self.organisms:
             print("Simulation not initialized.")
             return
 
@@ -64,15 +138,8 @@ class SimulationManager:
         while self.is_running:
             start_time = time.time()
 
-            # --- Run one step of the top-level organism cycle ---
-            # This will recursively step through all sub-cycles (system, component, cell)
-            self.organism_cycle.run_simulation_step()
-
-            # --- Update simulation time ---
-            # Note: The actual time represented by a step depends on the 'dt' used
-            #       within the iteration stages of the sub-cycles.
-            #       This is simplified for the template.
-            self.simulation_time += 1.0 / self.steps_per_second
+            # --- Run one step of every organism (and the arena, if any) ---
+            self.run_simulation_step()
 
             # --- Visualization (Optional) ---
             # Update any visualization based on self.organism_cycle.get_state()
@@ -0,0 +1,134 @@
+# mict/synaptic_delay.py
+from array import array
+from typing import Dict, Any, List, Sequence, Tuple, Union
+
+from .connectivity import SparseWeights
+
+# A synapse is (pre-synaptic cell ID, post-synaptic cell ID, weight, delay in steps).
+Synapse = Tuple[str, str, float, int]
+
+
+class DelayLine:
+    """
+    Delivers cell outputs to their targets after per-synapse transmission delays.
+
+    Outputs emitted at step t through a synapse with delay d are accumulated (weighted)
+    into a ring buffer slot indexed by (t + d) mod max_delay. Each slot is a flat array with
+    one entry per cell, so the synaptic input for a step is a single array read; there are
+    no per-synapse queues.
+
+    Weights are read from a SparseWeights matrix (`self.weights`) at emission time, so a
+    plasticity module adapting that matrix (e.g., STDPPlasticity) changes transmission.
+
+    Typical loop (one step = one full cell cycle):
+        inputs = delay_line.read()          # Input arriving at this step, indexed like cell_ids
+        ... step the cells ...
+        delay_line.emit(cell_id, output)    # For each cell with a nonzero output
+        delay_line.advance()
+
+    Args:
+        weights (SparseWeights): The weight matrix to transmit through (shared, not copied).
+        delays (Dict[Tuple[str, str], int]): (pre_id, post_id) -> delay in steps (integer >= 1).
+        default_delay (int): Delay of synapses missing from `delays`.
+    """
+    def __init__(self, weights: SparseWeights, delays: Dict[Tuple[str, str], int], default_delay: int = 1):
+        self.weights = weights
+        self.cell_ids = weights.cell_ids
+        self.index_of = weights.index_of
+        n = len(self.cell_ids)
+
+        # Outgoing synapses grouped by pre-synaptic index: [(delay, post_index, data index), ...]
+        self._outgoing: List[List[Tuple[int, int, int]]] = [[] for _ in range(n)]
+        used = []
+        for pre in range(n):
+            for k in weights.outgoing[pre]:
+                post = weights.post_index[k]
+                pre_id, post_id = self.cell_ids[pre], self.cell_ids[post]
+                delay = delays.get((pre_id, post_id), default_delay)
+                if not isinstance(delay, int) or delay < 1:
+                    raise ValueError(f"Synapse {pre_id}->{post_id}: delay must be an integer >= 1 step, got {delay!r}")
+                self._outgoing[pre].append((delay, post, k))
+                used.append(delay)
+
+        # No output can reach another cell in fewer than min_delay steps, so a partitioned
+        # engine only needs to exchange outputs between partitions every min_delay steps.
+        self.min_delay = min(used) if used else 1
+        self.max_delay = max(used) if used else 1
+        self.step = 0
+
+        self._zeros = array("d", bytes(8 * n))
+        self._ring = [array("d", self._zeros) for _ in range(self.max_delay)]
+        self._spare = array("d", self._zeros)
+        self._current = self._spare
+        self._taken = False
+
+    @classmethod
+    def from_synapses(cls, cell_ids: List[str], synapses: Sequence[Synapse]) -> "DelayLine":
+        """
+        Builds a delay line (and its SparseWeights) from a list of synapses.
+
+        Args:
+            cell_ids (List[str]): The cells, in the order used for input arrays.
+            synapses (List[Tuple[str, str, float, int]]): (pre_id, post_id, weight, delay) entries.
+        """
+        delays: Dict[Tuple[str, str], int] = {}
+        for pre_id, post_id, _, delay in synapses:
+            if delays.setdefault((pre_id, post_id), delay) != delay:
+                raise ValueError(f"Synapse {pre_id}->{post_id} is listed with different delays")
+        weights = SparseWeights(cell_ids, [(pre_id, post_id, weight) for pre_id, post_id, weight, _ in synapses])
+        return cls(weights, delays)
+
+    def _take_slot(self):
+        # Swap the arriving slot out for a cleared buffer before anything is emitted this step,
+        # so a synapse with delay == max_delay can safely reuse the same slot index.
+        slot = self.step % self.max_delay
+        self._spare[:] = self._zeros
+        self._current = self._ring[slot]
+        self._ring[slot] = self._spare
+        self._spare = self._current
+        self._taken = True
+
+    def read(self) -> array:
+        """
+        Returns the synaptic input arriving at the current step.
+
+        The array is a reused ring buffer slot: the next step's first `read()`, `emit()` or
+        `advance()` clears it and fills it with new emissions. Copy it (`array('d', inputs)`)
+        to keep the values beyond that.
+        """
+        if not self._taken:
+            self._take_slot()
+        return self._current
+
+    def read_cell(self, cell_id: str) -> float:
+        """Returns the synaptic input arriving at the current step for one cell."""
+        return self.read()[self.index_of[cell_id]]
+
+    def emit(self, cell_id: Union[str, int], value: float):
+        """Sends a cell's output produced at the current step through its outgoing synapses."""
+        if not value:
+            return # Silent cells cost nothing
+        if not self._taken:
+            self._take_slot()
+        index = cell_id if isinstance(cell_id, int) else self.index_of[cell_id]
+        ring, size, t, data = self._ring, self.max_delay, self.step, self.weights.data
+        for delay, post, k in self._outgoing[index]:
+            ring[(t + delay) % size][post] += data[k] * value
+
+    def emit_all(self, outputs: Sequence[float]):
+        """Emits the outputs of every cell (indexed like cell_ids) for the current step."""
+        for index, value in enumerate(outputs):
+            if value:
+                self.emit(index, value)
+
+    def advance(self):
+        """Moves to the next step."""
+        if not self._taken:
+            self._take_slot() # Drop input nobody read
+        self._taken = False
+        self.step += 1
+
+    def get_state(self) -> Dict[str, Any]:
+        """Returns a summary of the delay line (for logging)."""
+        return {"step": self.step, "min_delay": self.min_delay, "max_delay": self.max_delay,
+                "n_synapses": len(self.weights)}
@@ -18,6 +18,16 @@ class SystemMICT:
         self.system_id = system_id
         self.system_type = system_type
         self.component_cycles = component_cycles
+        for comp_cycle in component_cycles:
+            comp_cycle.parent = self
+
+        # --- Quiescence Tracking (the system idles when all its components are quiescent) ---
+        self.quiescent = False
+        self.executed_steps = 0
+        self.skipped_steps = 0
+        self._dirty = False
+        self._tick = 0
+        self._idle_steps = 0
 
         # --- Define MICT Stage Functions for a System ---
         def mapping(state: Dict) -> Dict:
@@ -74,6 +84,7 @@ class SystemMICT:
 
         self.engine = MICT(config)
         self.currentState = self.engine.currentState
+        self.cycle_length = len(config["stages"])
 
     def _update_state(self, new_state: Dict, stage: str):
         self.currentState = new_state
@@ -84,8 +95,48 @@ class SystemMICT:
         # TODO: Implement error handling
 
     def step(self):
-        """Advances the system's MICT cycle by one step."""
+        """Advances the system's MICT cycle by one step (or skips it while quiescent)."""
+        if self.quiescent:
+            if self._dirty and self._tick % self.cycle_length == 0:
+                self._resume()
+            else:
+                self._tick += 1
+                self._idle_steps += 1
+                self.skipped_steps += 1
+                return
         self.engine.next_stage()
+        self.executed_steps += 1
+        self._tick += 1
+        if self._tick % self.cycle_length == 0:
+            if (not self._dirty and self.component_cycles
+                    and all(comp_cycle.is_idle() for comp_cycle in self.component_cycles)):
+                self.quiescent = True
+                self._idle_steps = 0
+            self._dirty = False
+
+    # --- Quiescence ---
+
+    def wake(self):
+        """Marks the system dirty so it resumes at the next cycle boundary."""
+        self._dirty = True
+
+    def _resume(self):
+        """Leaves quiescence, crediting components with the steps they missed."""
+        # Components are stepped once per system cycle (in Iteration)
+        missed = self._idle_steps // self.cycle_length
+        for comp_cycle in self.component_cycles:
+            comp_cycle._skip(missed)
+        self.quiescent = False
+        self._idle_steps = 0
+
+    def get_work_counters(self) -> Dict[str, Any]:
+        """Returns executed/skipped step counts for the system and each of its components."""
+        return {
+            "executed_steps": self.executed_steps,
+            "skipped_steps": self.skipped_steps,
+            "quiescent": self.quiescent,
+            "components": {c.component_id: c.get_work_counters() for c in self.component_cycles},
+        }
 
     def get_state(self) -> Dict:
         """Returns the current state of the system."""